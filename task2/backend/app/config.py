@@ -3,14 +3,19 @@ Configuration settings loaded from environment variables
 """
 
 from pydantic_settings import BaseSettings
-from typing import List
-from functools import lru_cache
+from typing import List, Literal
+from functools import lru_cache, cached_property
 
 
 class Settings(BaseSettings):
     """Application settings"""
     mongodb_uri: str = "mongodb://localhost:27017"
     mongodb_db_name: str = "feedback_db"
+    mongo_max_pool_size: int = 50
+    mongo_min_pool_size: int = 10
+    mongo_max_idle_time_ms: int = 60000
+    mongo_wait_queue_timeout_ms: int = 5000
+    mongo_compressors: str = "zstd,zlib"
     openai_api_key: str = ""
     admin_password: str = "admin123"
     frontend_url: str = "http://localhost:8000"
@@ -19,11 +24,27 @@ class Settings(BaseSettings):
     cors_origins: str = "http://localhost:8000,http://127.0.0.1:8000"
     llm_model: str = "gpt-4o-mini"
     llm_timeout: int = 30
+    llm_max_retries: int = 1
+    llm_response_timeout: int = 15
+    llm_cache_mode: Literal["enabled", "readonly", "replay", "disabled"] = "enabled"
+    llm_cache_local_size: int = 10000
+    llm_cache_local_ttl_seconds: int = 3600
+    llm_cache_ttl_seconds: int = 604800
+    llm_batch_max_size: int = 8
+    # Provider calls are made one per prompt, so waiting out a window only adds
+    # latency; 0 dispatches whatever is queued right away
+    llm_batch_timeout_ms: int = 0
+    llm_max_inflight: int = 32
+    review_write_batch_size: int = 50
+    review_write_batch_timeout_ms: int = 50
     session_expire_hours: int = 24
+    debug: bool = False
+    serve_static: bool = True
+    search_substring_fallback: bool = False
     
-    @property
+    @cached_property
     def cors_origins_list(self) -> List[str]:
-        """Parse CORS origins string into list"""
+        """Parse CORS origins string into list (computed once per instance)"""
         return [origin.strip() for origin in self.cors_origins.split(",")]
     
     class Config:
@@ -35,3 +56,12 @@ class Settings(BaseSettings):
 def get_settings() -> Settings:
     """Get cached settings instance"""
     return Settings()
+
+
+# Scalars read on request hot paths, bound once at import
+_settings = get_settings()
+ADMIN_PASSWORD: str = _settings.admin_password
+SESSION_EXPIRE_HOURS: int = _settings.session_expire_hours
+LLM_MODEL: str = _settings.llm_model
+LLM_TIMEOUT: int = _settings.llm_timeout
+LLM_RESPONSE_TIMEOUT: int = _settings.llm_response_timeout
@@ -1,29 +1,40 @@
 """
-MongoDB Atlas connection using Motor
+MongoDB Atlas connection using the native PyMongo async driver
 """
 
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from pymongo import AsyncMongoClient, IndexModel
+from pymongo.asynchronous.database import AsyncDatabase
+from pymongo.asynchronous.collection import AsyncCollection
 from typing import Optional
 import logging
 
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
-_client: Optional[AsyncIOMotorClient] = None
-_database: Optional[AsyncIOMotorDatabase] = None
+_client: Optional[AsyncMongoClient] = None
+_database: Optional[AsyncDatabase] = None
+_reviews_collection: Optional[AsyncCollection] = None
+_sessions_collection: Optional[AsyncCollection] = None
+_llm_cache_collection: Optional[AsyncCollection] = None
 
 
 async def connect_to_mongodb():
     """Initialize MongoDB connection"""
-    global _client, _database
+    global _client, _database, _reviews_collection, _sessions_collection, _llm_cache_collection
     
     settings = get_settings()
     
     try:
         logger.info("Connecting to MongoDB Atlas...")
-        _client = AsyncIOMotorClient(
+        _client = AsyncMongoClient(
             settings.mongodb_uri,
-            serverSelectionTimeoutMS=5000
+            serverSelectionTimeoutMS=5000,
+            maxPoolSize=settings.mongo_max_pool_size,
+            minPoolSize=settings.mongo_min_pool_size,
+            maxIdleTimeMS=settings.mongo_max_idle_time_ms,
+            waitQueueTimeoutMS=settings.mongo_wait_queue_timeout_ms,
+            retryWrites=True,
+            compressors=settings.mongo_compressors
         )
         
         await _client.admin.command('ping')
@@ -31,6 +42,10 @@ async def connect_to_mongodb():
         _database = _client[settings.mongodb_db_name]
         await _create_indexes()
         
+        _reviews_collection = _database.reviews
+        _sessions_collection = _database.admin_sessions
+        _llm_cache_collection = _database.llm_cache
+        
         logger.info(f"Connected to MongoDB database: {settings.mongodb_db_name}")
         
     except Exception as e:
@@ -45,20 +60,35 @@ async def _create_indexes():
     if _database is None:
         return
     
-    reviews_collection = _database.reviews
-    await reviews_collection.create_index(
-        [("metadata.submission_time", -1)],
-        name="submission_time_desc"
-    )
-    await reviews_collection.create_index(
-        [("rating", 1)],
-        name="rating_filter"
-    )
+    await _database.reviews.create_indexes([
+        IndexModel([("metadata.submission_time", -1)], name="submission_time_desc"),
+        IndexModel(
+            [("rating", 1), ("metadata.submission_time", -1)],
+            name="rating_time_compound"
+        ),
+        IndexModel(
+            [("rating", 1), ("metadata.status", 1), ("metadata.submission_time", -1)],
+            name="rating_status_compound"
+        ),
+        IndexModel(
+            [("metadata.status", 1), ("metadata.submission_time", -1)],
+            name="status_time_compound"
+        ),
+        IndexModel([("metadata.submission_date", -1)], name="submission_date_desc"),
+        IndexModel([("review_text", "text")], name="review_text_search")
+    ])
+    
+    await _database.admin_sessions.create_indexes([
+        IndexModel([("expires_at", 1)], expireAfterSeconds=0, name="session_ttl")
+    ])
     
-    await reviews_collection.create_index(
-        [("metadata.status", 1), ("metadata.submission_time", -1)],
-        name="status_time_compound"
-    )
+    await _database.llm_cache.create_indexes([
+        IndexModel(
+            [("created_at", 1)],
+            expireAfterSeconds=get_settings().llm_cache_ttl_seconds,
+            name="llm_cache_ttl"
+        )
+    ])
     
     logger.info("Database indexes created")
 
@@ -68,11 +98,11 @@ async def close_mongodb_connection():
     global _client
     
     if _client:
-        _client.close()
+        await _client.close()
         logger.info("MongoDB connection closed")
 
 
-def get_database() -> AsyncIOMotorDatabase:
+def get_database() -> AsyncDatabase:
     """Get database instance"""
     global _database
     
@@ -82,6 +112,22 @@ def get_database() -> AsyncIOMotorDatabase:
     return _database
 
 
-def get_reviews_collection():
+def _require(collection: Optional[AsyncCollection]) -> AsyncCollection:
+    if collection is None:
+        raise RuntimeError("Database not initialized. Call connect_to_mongodb() first.")
+    return collection
+
+
+def get_reviews_collection() -> AsyncCollection:
     """Get reviews collection"""
-    return get_database().reviews
+    return _require(_reviews_collection)
+
+
+def get_sessions_collection() -> AsyncCollection:
+    """Get admin sessions collection"""
+    return _require(_sessions_collection)
+
+
+def get_llm_cache_collection() -> AsyncCollection:
+    """Get LLM response cache collection"""
+    return _require(_llm_cache_collection)
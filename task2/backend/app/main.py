@@ -9,7 +9,9 @@ from pathlib import Path
 import uvicorn
 from app.config import get_settings
 from app.database import connect_to_mongodb, close_mongodb_connection
+from app.services.review_service import review_writer
 from app.routes import user_router, admin_router
+from app.routes.user import llm_service
 from app.utils.error_handlers import setup_exception_handlers
 logging.basicConfig(
     level=logging.INFO,
@@ -26,10 +28,15 @@ async def lifespan(app: FastAPI):
     """Application lifespan manager"""
     logger.info("Starting AI Feedback System...")
     await connect_to_mongodb()
+    review_writer.start()
     logger.info("Application started successfully")
     
     yield
     logger.info("Shutting down...")
+    # LLM batches finishing during shutdown may still queue review saves,
+    # so the writer has to stop after the LLM batcher
+    await llm_service.stop()
+    await review_writer.stop()
     await close_mongodb_connection()
     logger.info("Application shutdown complete")
 
@@ -58,7 +65,8 @@ app.include_router(user_router)
 app.include_router(admin_router)
 frontend_path = Path(__file__).parent.parent.parent / "frontend" / "public"
 
-if frontend_path.exists():
+# In production the reverse proxy serves the dashboards (see deploy/nginx.conf)
+if settings.serve_static and frontend_path.exists():
     user_path = frontend_path / "user"
     if user_path.exists():
         app.mount("/user", StaticFiles(directory=str(user_path), html=True), name="user-dashboard")
@@ -92,5 +100,7 @@ if __name__ == "__main__":
         "app.main:app",
         host=settings.backend_host,
         port=settings.backend_port,
-        reload=True
+        loop="auto",
+        http="httptools",
+        reload=settings.debug
     )
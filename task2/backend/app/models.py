@@ -2,8 +2,8 @@
 Pydantic schemas for request/response validation
 """
 
-from pydantic import BaseModel, Field, field_validator
-from typing import List, Optional, Dict
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from typing import List, Optional
 from datetime import datetime
 from enum import Enum
 
@@ -48,13 +48,14 @@ class ReviewSubmissionRequest(BaseModel):
             raise ValueError("Review must contain at least 10 non-whitespace characters")
         return stripped
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "rating": 5,
                 "review_text": "The food was absolutely amazing! Great service too."
             }
         }
+    )
 
 
 class ReviewSubmissionResponse(BaseModel):
@@ -66,8 +67,8 @@ class ReviewSubmissionResponse(BaseModel):
     submission_id: str = Field(description="Unique ID of the submission")
     processing_time_ms: int = Field(description="Total processing time in milliseconds")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "Review submitted successfully",
@@ -76,6 +77,7 @@ class ReviewSubmissionResponse(BaseModel):
                 "processing_time_ms": 2100
             }
         }
+    )
 
 
 class AdminLoginRequest(BaseModel):
@@ -83,12 +85,13 @@ class AdminLoginRequest(BaseModel):
     
     password: str = Field(min_length=1, description="Admin password")
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "password": "admin123"
             }
         }
+    )
 
 
 class AdminLoginResponse(BaseModel):
@@ -99,15 +102,16 @@ class AdminLoginResponse(BaseModel):
     token: Optional[str] = None
     expires_in_hours: Optional[int] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "message": "Login successful",
-                "token": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
+                "token": "Xk3vQ9pL2mN8rT5wY7zA1bC4dE6fG0hJ-iK_lM3nO5q",
                 "expires_in_hours": 24
             }
         }
+    )
 
 
 class ReviewMetadata(BaseModel):
@@ -131,8 +135,8 @@ class ReviewItem(BaseModel):
     submission_time: datetime
     status: str
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "id": "65a1b2c3d4e5f67890123456",
                 "rating": 5,
@@ -144,6 +148,7 @@ class ReviewItem(BaseModel):
                 "status": "processed"
             }
         }
+    )
 
 
 class ReviewsListResponse(BaseModel):
@@ -155,8 +160,8 @@ class ReviewsListResponse(BaseModel):
     page_size: int
     has_more: bool
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "reviews": [],
                 "total_count": 156,
@@ -165,11 +170,14 @@ class ReviewsListResponse(BaseModel):
                 "has_more": True
             }
         }
+    )
 
 
 class RatingDistribution(BaseModel):
     """Rating distribution for analytics"""
     
+    model_config = ConfigDict(populate_by_name=True)
+    
     star_1: int = Field(default=0, alias="1")
     star_2: int = Field(default=0, alias="2")
     star_3: int = Field(default=0, alias="3")
@@ -182,12 +190,12 @@ class AnalyticsResponse(BaseModel):
     
     total_reviews: int
     average_rating: float
-    rating_distribution: Dict[str, int]
+    rating_distribution: RatingDistribution
     reviews_today: int
     reviews_this_week: int
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "total_reviews": 156,
                 "average_rating": 4.2,
@@ -202,6 +210,7 @@ class AnalyticsResponse(BaseModel):
                 "reviews_this_week": 23
             }
         }
+    )
 
 
 class ReviewDocument(BaseModel):
@@ -222,11 +231,12 @@ class ErrorResponse(BaseModel):
     error: str
     detail: Optional[str] = None
     
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": False,
                 "error": "Validation Error",
                 "detail": "Review text must be at least 10 characters"
             }
         }
+    )
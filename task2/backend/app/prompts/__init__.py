@@ -1,3 +1,3 @@
-from app.prompts.unified_prompt import UNIFIED_REVIEW_ANALYSIS_PROMPT
+from app.prompts.unified_prompt import UNIFIED_REVIEW_ANALYSIS_PROMPT, render_unified_prompt
 
-__all__ = ["UNIFIED_REVIEW_ANALYSIS_PROMPT"]
+__all__ = ["UNIFIED_REVIEW_ANALYSIS_PROMPT", "render_unified_prompt"]
@@ -3,6 +3,10 @@ Unified prompt for generating all review analysis outputs.
 Combines admin summary, recommended actions, and user response generation.
 """
 
+import sys
+from string import Formatter
+from typing import Optional, Tuple
+
 UNIFIED_REVIEW_ANALYSIS_PROMPT = """You are an AI assistant that analyzes customer reviews and generates three distinct outputs: an internal business summary, actionable recommendations, and a customer-facing response.
 
 CUSTOMER REVIEW:
@@ -105,3 +109,23 @@ Guidelines:
 ---
 
 IMPORTANT: Generate all three outputs with appropriate content for a {rating}-star review. Ensure the admin_summary is objective, recommended_actions are actionable, and user_response is warm and personalized."""
+
+
+def _compile_template(template: str) -> Tuple[Tuple[str, Optional[str]], ...]:
+    """Split a format template once into (literal, field_name) fragments"""
+    return tuple(
+        (sys.intern(literal), field_name)
+        for literal, field_name, _, _ in Formatter().parse(template)
+    )
+
+
+_UNIFIED_FRAGMENTS = _compile_template(UNIFIED_REVIEW_ANALYSIS_PROMPT)
+
+
+def render_unified_prompt(rating: int, review_text: str) -> str:
+    """Fill UNIFIED_REVIEW_ANALYSIS_PROMPT without re-parsing the template"""
+    values = {"rating": str(rating), "review_text": review_text}
+    return "".join([
+        literal + values[field_name] if field_name else literal
+        for literal, field_name in _UNIFIED_FRAGMENTS
+    ])
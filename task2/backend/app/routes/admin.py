@@ -4,9 +4,9 @@ Admin dashboard API endpoints
 
 from fastapi import APIRouter, HTTPException, status, Depends, Query
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional
-import uuid
+import secrets
 import logging
 
 from app.models import (
@@ -17,45 +17,36 @@ from app.models import (
     ErrorResponse
 )
 from app.services.review_service import ReviewService
-from app.config import get_settings
+from app.services.session_service import SessionService
+from app.config import ADMIN_PASSWORD, SESSION_EXPIRE_HOURS
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/admin", tags=["Admin"])
 security = HTTPBearer()
-_active_tokens: dict = {}
+_admin_password_bytes = ADMIN_PASSWORD.encode("utf-8")
 review_service = ReviewService()
+session_service = SessionService()
 
 
 def generate_token() -> tuple[str, datetime]:
     """Generate a new session token"""
-    settings = get_settings()
-    token = str(uuid.uuid4())
-    expires_at = datetime.utcnow() + timedelta(hours=settings.session_expire_hours)
+    token = secrets.token_urlsafe(32)
+    expires_at = datetime.now(timezone.utc) + timedelta(hours=SESSION_EXPIRE_HOURS)
     return token, expires_at
 
 
-def validate_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
+async def validate_token(credentials: HTTPAuthorizationCredentials = Depends(security)) -> str:
     """Validate the bearer token"""
     token = credentials.credentials
     
-    if token not in _active_tokens:
+    if await session_service.get_session(token) is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired token. Please log in again.",
             headers={"WWW-Authenticate": "Bearer"}
         )
     
-    token_data = _active_tokens[token]
-    
-    if datetime.utcnow() > token_data["expires_at"]:
-        del _active_tokens[token]
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Token expired. Please log in again.",
-            headers={"WWW-Authenticate": "Bearer"}
-        )
-    
     return token
 
 
@@ -76,19 +67,17 @@ async def admin_login(request: AdminLoginRequest):
     
     Returns session token on successful authentication.
     """
-    settings = get_settings()
-    
-    if request.password != settings.admin_password:
+    if not secrets.compare_digest(
+        request.password.encode("utf-8"),
+        _admin_password_bytes
+    ):
         logger.warning("Failed admin login attempt")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid password"
         )
     token, expires_at = generate_token()
-    _active_tokens[token] = {
-        "created_at": datetime.utcnow(),
-        "expires_at": expires_at
-    }
+    await session_service.create_session(token, expires_at)
     
     logger.info("Admin logged in successfully")
     
@@ -96,7 +85,7 @@ async def admin_login(request: AdminLoginRequest):
         success=True,
         message="Login successful",
         token=token,
-        expires_in_hours=settings.session_expire_hours
+        expires_in_hours=SESSION_EXPIRE_HOURS
     )
 
 
@@ -107,8 +96,7 @@ async def admin_login(request: AdminLoginRequest):
 )
 async def admin_logout(token: str = Depends(validate_token)):
     """Logout and invalidate token"""
-    if token in _active_tokens:
-        del _active_tokens[token]
+    await session_service.delete_session(token)
     
     return {"success": True, "message": "Logged out successfully"}
 
@@ -128,7 +116,7 @@ async def get_reviews(
     page_size: int = Query(default=20, ge=1, le=100, description="Items per page"),
     rating: Optional[int] = Query(default=None, ge=1, le=5, description="Filter by rating"),
     search: Optional[str] = Query(default=None, description="Search in review text"),
-    sort_by: str = Query(default="submission_time", description="Sort field"),
+    sort_by: str = Query(default="submission_time", description="Sort field (submission_time, rating, status, relevance)"),
     sort_order: str = Query(default="desc", description="Sort order (asc/desc)")
 ):
     """
@@ -138,7 +126,7 @@ async def get_reviews(
     - **page_size**: Number of items per page (max 100)
     - **rating**: Optional filter by star rating
     - **search**: Optional text search in reviews
-    - **sort_by**: Field to sort by
+    - **sort_by**: Field to sort by; `relevance` ranks text-search matches
     - **sort_order**: Sort direction (asc/desc)
     """
     try:
@@ -151,7 +139,7 @@ async def get_reviews(
             sort_order=sort_order
         )
         
-        return ReviewsListResponse(
+        return ReviewsListResponse.model_construct(
             reviews=result["reviews"],
             total_count=result["total_count"],
             page=page,
@@ -160,7 +148,7 @@ async def get_reviews(
         )
         
     except Exception as e:
-        logger.error(f"Error fetching reviews: {e}")
+        logger.error("Error fetching reviews: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch reviews"
@@ -198,7 +186,7 @@ async def get_analytics(token: str = Depends(validate_token)):
         )
         
     except Exception as e:
-        logger.error(f"Error fetching analytics: {e}")
+        logger.error("Error fetching analytics: %s", e)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to fetch analytics"
@@ -215,6 +203,6 @@ async def health_check():
     return {
         "status": "healthy",
         "service": "admin-api",
-        "timestamp": datetime.utcnow().isoformat(),
-        "active_sessions": len(_active_tokens)
+        "timestamp": datetime.now(timezone.utc),
+        "active_sessions": await session_service.count_active_sessions()
     }
@@ -2,10 +2,15 @@
 User-facing API endpoints
 """
 
-from fastapi import APIRouter, HTTPException, status
-from datetime import datetime
+from fastapi import APIRouter, BackgroundTasks, HTTPException, status
+from fastapi.responses import StreamingResponse
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Tuple
+import asyncio
 import time
 import logging
+import orjson
+from bson import ObjectId
 
 from app.models import (
     ReviewSubmissionRequest,
@@ -14,6 +19,8 @@ from app.models import (
 )
 from app.services.review_service import ReviewService
 from app.services.llm_service import LLMService
+from app.config import LLM_RESPONSE_TIMEOUT
+from app.utils.validators import validate_review_text
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +28,25 @@ router = APIRouter(prefix="/api/user", tags=["User"])
 review_service = ReviewService()
 llm_service = LLMService()
 
+# Reviews longer than this are validated off the event loop
+VALIDATE_IN_THREAD_MIN_LENGTH = 200
+
+
+async def _validate_review(review_text: str) -> Tuple[bool, str]:
+    """Run validate_review_text, in a worker thread for long reviews"""
+    if len(review_text) > VALIDATE_IN_THREAD_MIN_LENGTH:
+        return await asyncio.to_thread(validate_review_text, review_text)
+    return validate_review_text(review_text)
+
+
+async def _persist_review(document: dict) -> None:
+    """Save a review after the response has been sent, logging any failure"""
+    try:
+        submission_id = await review_service.save_review(document)
+        logger.info("Review saved successfully: %s", submission_id)
+    except Exception as e:
+        logger.error("Failed to save review %s: %s", document["_id"], e)
+
 
 @router.post(
     "/submit-review",
@@ -33,83 +59,167 @@ llm_service = LLMService()
     summary="Submit a new review",
     description="Submit a user review with rating (1-5) and review text. Returns AI-generated response."
 )
-async def submit_review(request: ReviewSubmissionRequest):
+async def submit_review(request: ReviewSubmissionRequest, background_tasks: BackgroundTasks):
     """
     Submit a new review and receive AI-generated response.
     
     - **rating**: Star rating from 1 to 5
     - **review_text**: Review text (10-1000 characters)
     
-    Returns AI-generated response and stores review with admin summary.
+    Returns AI-generated response; the review and admin summary are stored
+    after the response has been sent.
     """
     start_time = time.time()
     
     try:
-        logger.info(f"Received review submission: rating={request.rating}, text_length={len(request.review_text)}")
+        logger.info("Received review submission: rating=%s, text_length=%d", request.rating, len(request.review_text))
         
-        llm_results = await llm_service.process_review(
-            rating=request.rating,
-            review_text=request.review_text
+        is_valid, error_message = await _validate_review(request.review_text)
+        if not is_valid:
+            raise ValueError(error_message)
+        
+        llm_results = await asyncio.wait_for(
+            llm_service.process_review(
+                rating=request.rating,
+                review_text=request.review_text
+            ),
+            timeout=LLM_RESPONSE_TIMEOUT
         )
         processing_time_ms = int((time.time() - start_time) * 1000)
-        submission_id = await review_service.save_review(
-            rating=request.rating,
-            review_text=request.review_text,
-            user_response=llm_results["user_response"],
-            admin_summary=llm_results["admin_summary"],
-            recommended_actions=llm_results["recommended_actions"],
-            processing_time_ms=processing_time_ms,
-            llm_model=llm_results["model_used"]
+        review_id = ObjectId()
+        background_tasks.add_task(
+            _persist_review,
+            review_service.build_review_doc(
+                rating=request.rating,
+                review_text=request.review_text,
+                llm_results=llm_results,
+                processing_time_ms=processing_time_ms,
+                review_id=review_id
+            )
         )
         
-        logger.info(f"Review saved successfully: {submission_id}")
-        
-        return ReviewSubmissionResponse(
+        return ReviewSubmissionResponse.model_construct(
             success=True,
             message="Review submitted successfully! Thank you for your feedback.",
             user_response=llm_results["user_response"],
-            submission_id=submission_id,
+            submission_id=str(review_id),
             processing_time_ms=processing_time_ms
         )
         
     except ValueError as e:
-        logger.warning(f"Validation error: {e}")
+        logger.warning("Validation error: %s", e)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
         
     except Exception as e:
-        logger.error(f"Error processing review: {e}")
-        try:
-            fallback_response = llm_service.get_fallback_response(request.rating)
-            processing_time_ms = int((time.time() - start_time) * 1000)
-            
-            submission_id = await review_service.save_review(
+        if isinstance(e, asyncio.TimeoutError):
+            logger.warning("LLM did not respond within %ss, returning fallback", LLM_RESPONSE_TIMEOUT)
+        else:
+            logger.error("Error processing review: %s", e)
+        fallback_response = llm_service.get_fallback_response(request.rating)
+        processing_time_ms = int((time.time() - start_time) * 1000)
+        review_id = ObjectId()
+        background_tasks.add_task(
+            _persist_review,
+            review_service.build_review_doc(
                 rating=request.rating,
                 review_text=request.review_text,
-                user_response=fallback_response,
-                admin_summary="[Processing failed - manual review needed]",
-                recommended_actions="[Processing failed - manual review needed]",
+                llm_results={
+                    "user_response": fallback_response,
+                    "admin_summary": "[Processing failed - manual review needed]",
+                    "recommended_actions": "[Processing failed - manual review needed]",
+                    "model_used": "fallback"
+                },
                 processing_time_ms=processing_time_ms,
-                llm_model="fallback",
-                status="failed"
-            )
-            
-            return ReviewSubmissionResponse(
-                success=True,
-                message="Review submitted successfully!",
-                user_response=fallback_response,
-                submission_id=submission_id,
-                processing_time_ms=processing_time_ms
+                status="failed",
+                review_id=review_id
             )
-            
-        except Exception as save_error:
-            logger.error(f"Failed to save review: {save_error}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Unable to process your review. Please try again later."
+        )
+        
+        return ReviewSubmissionResponse.model_construct(
+            success=True,
+            message="Review submitted successfully!",
+            user_response=fallback_response,
+            submission_id=str(review_id),
+            processing_time_ms=processing_time_ms
+        )
+
+
+def _sse_event(event: str, data: Any) -> bytes:
+    """Frame a single Server-Sent Event"""
+    return b"event: " + event.encode("utf-8") + b"\ndata: " + orjson.dumps(data) + b"\n\n"
+
+
+@router.post(
+    "/submit-review/stream",
+    responses={
+        200: {"content": {"text/event-stream": {}}, "description": "Server-Sent Events stream"},
+        400: {"model": ErrorResponse, "description": "Validation Error"}
+    },
+    summary="Submit a new review (streaming)",
+    description="Submit a user review and stream the AI-generated response as Server-Sent Events."
+)
+async def submit_review_stream(request: ReviewSubmissionRequest, background_tasks: BackgroundTasks):
+    """
+    Submit a new review and stream the AI-generated response.
+    
+    Emits `delta` events carrying fragments of the user response while it is
+    generated, then a single `done` event with the same fields as
+    `/submit-review`. The review is stored after the stream has closed.
+    """
+    start_time = time.time()
+    logger.info("Received streaming review submission: rating=%s, text_length=%d", request.rating, len(request.review_text))
+    
+    is_valid, error_message = await _validate_review(request.review_text)
+    if not is_valid:
+        logger.warning("Validation error: %s", error_message)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=error_message
+        )
+    
+    async def event_stream() -> AsyncIterator[bytes]:
+        llm_results = None
+        async for event, data in llm_service.stream_review(
+            rating=request.rating,
+            review_text=request.review_text
+        ):
+            if event == "delta":
+                yield _sse_event("delta", {"text": data})
+            else:
+                llm_results = data
+        
+        processing_time_ms = int((time.time() - start_time) * 1000)
+        review_id = ObjectId()
+        # Tasks added while streaming still run: FastAPI attaches
+        # background_tasks to the response and drains it after the body ends.
+        background_tasks.add_task(
+            _persist_review,
+            review_service.build_review_doc(
+                rating=request.rating,
+                review_text=request.review_text,
+                llm_results=llm_results,
+                processing_time_ms=processing_time_ms,
+                status="processed" if llm_results["model_used"] != "fallback" else "failed",
+                review_id=review_id
             )
+        )
+        
+        yield _sse_event("done", {
+            "success": True,
+            "message": "Review submitted successfully! Thank you for your feedback.",
+            "user_response": llm_results["user_response"],
+            "submission_id": str(review_id),
+            "processing_time_ms": processing_time_ms
+        })
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
 
 
 @router.get(
@@ -119,4 +229,4 @@ async def submit_review(request: ReviewSubmissionRequest):
 )
 async def health_check():
     """Health check endpoint"""
-    return {"status": "healthy", "service": "user-api", "timestamp": datetime.utcnow().isoformat()}
+    return {"status": "healthy", "service": "user-api", "timestamp": datetime.now(timezone.utc)}
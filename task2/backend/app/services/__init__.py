@@ -4,5 +4,6 @@ Services package initialization
 
 from app.services.llm_service import LLMService
 from app.services.review_service import ReviewService
+from app.services.session_service import SessionService
 
-__all__ = ["LLMService", "ReviewService"]
+__all__ = ["LLMService", "ReviewService", "SessionService"]
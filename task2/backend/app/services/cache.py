@@ -0,0 +1,114 @@
+"""
+LLM response cache keyed by a SHA256 digest of prompt, model, temperature and input.
+
+Lookups go to an in-process TTL cache first and fall back to MongoDB, so
+duplicate submissions handled by the same worker never leave the process.
+Only the hash is used as the key; raw review text is never stored. MongoDB entries
+expire LLM_CACHE_TTL_SECONDS after they are written (TTL index on created_at).
+
+Modes (LLM_CACHE_MODE):
+- enabled:  read from and write to the cache
+- readonly: read from the cache, never write
+- replay:   read from the cache, never call the LLM on a miss
+- disabled: bypass the cache entirely
+"""
+
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+import hashlib
+import logging
+from cachetools import TTLCache
+
+from app.database import get_llm_cache_collection
+from app.utils.validators import sanitize_input
+
+logger = logging.getLogger(__name__)
+
+CACHED_FIELDS = ("user_response", "admin_summary", "recommended_actions", "model_used")
+
+
+class CacheMissError(LookupError):
+    """Raised in replay mode when a prompt has no cached response"""
+
+
+def normalize_review_text(review_text: str) -> str:
+    """Sanitize, lowercase and collapse whitespace so trivial variants share a cache key"""
+    return sanitize_input(review_text).lower()
+
+
+def make_cache_key(prompt_digest: str, model: str, temperature: float, rating: int, review_text: str) -> str:
+    """Build the SHA256 cache key for a single review analysis"""
+    payload = "\x1f".join((
+        prompt_digest,
+        model,
+        str(temperature),
+        str(rating),
+        normalize_review_text(review_text)
+    ))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """MongoDB-backed cache for structured LLM review analyses"""
+
+    def __init__(self, mode: str = "enabled", local_maxsize: int = 10_000, local_ttl_seconds: int = 3600):
+        self.mode = mode
+        self._local: TTLCache = TTLCache(maxsize=local_maxsize, ttl=local_ttl_seconds)
+
+    @property
+    def readable(self) -> bool:
+        return self.mode != "disabled"
+
+    @property
+    def writable(self) -> bool:
+        return self.mode == "enabled"
+
+    async def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached analysis.
+
+        Returns:
+            The cached result dict, or None on a miss
+
+        Raises:
+            CacheMissError: On a miss in replay mode
+        """
+        if not self.readable:
+            return None
+
+        local = self._local.get(key)
+        if local is not None:
+            return dict(local)
+
+        doc = None
+        try:
+            doc = await get_llm_cache_collection().find_one({"_id": key})
+        except Exception as e:
+            logger.warning("LLM cache lookup failed: %s", e)
+
+        if doc is None:
+            if self.mode == "replay":
+                raise CacheMissError(f"No cached LLM response for key {key[:12]}")
+            return None
+
+        result = {field: doc[field] for field in CACHED_FIELDS}
+        self._local[key] = result
+        return dict(result)
+
+    async def set(self, key: str, result: Dict[str, Any]) -> None:
+        """Store an analysis result; failures are logged and ignored"""
+        if not self.writable:
+            return
+
+        document = {field: result[field] for field in CACHED_FIELDS}
+        self._local[key] = dict(document)
+        document["created_at"] = datetime.now(timezone.utc)
+
+        try:
+            await get_llm_cache_collection().update_one(
+                {"_id": key},
+                {"$setOnInsert": document},
+                upsert=True
+            )
+        except Exception as e:
+            logger.warning("LLM cache write failed: %s", e)
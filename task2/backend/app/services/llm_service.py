@@ -3,25 +3,54 @@ LLM Service for generating AI responses using structured output.
 Single LLM call generates all three outputs: admin_summary, recommended_actions, user_response
 """
 
+import asyncio
+import hashlib
 import logging
-from typing import Dict, Any
+from typing import Dict, Any, AsyncIterator, List, Optional, Tuple
 
+import httpx
+from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
-from langchain_core.prompts import ChatPromptTemplate
 
-from app.config import get_settings
-from app.prompts.unified_prompt import UNIFIED_REVIEW_ANALYSIS_PROMPT
+from app.config import LLM_MODEL, LLM_TIMEOUT, get_settings
+from app.prompts.unified_prompt import UNIFIED_REVIEW_ANALYSIS_PROMPT, render_unified_prompt
 from app.models import LLMReviewAnalysis
+from app.services.cache import LLMResponseCache, make_cache_key
+from app.utils.batching import BatchScheduler
 
 logger = logging.getLogger(__name__)
 
-FALLBACK_RESPONSES = {
-    5: "Thank you for your excellent review! We're thrilled that you had such a wonderful experience with us. Your kind words mean a lot to our team!",
-    4: "Thank you for your positive feedback! We're glad you enjoyed your experience. We're always working to make things even better!",
-    3: "Thank you for your honest review. We appreciate your feedback and are always looking for ways to improve your experience.",
-    2: "We're sorry your experience didn't meet your expectations. Thank you for letting us know - your feedback helps us improve.",
-    1: "We sincerely apologize for your disappointing experience. We take your feedback very seriously and will work hard to address these issues."
-}
+LLM_TEMPERATURE = 0.5
+PROMPT_DIGEST = hashlib.sha256(UNIFIED_REVIEW_ANALYSIS_PROMPT.encode("utf-8")).hexdigest()
+# A dict schema makes the structured-output parser emit partial objects while
+# the completion is still streaming; the model class only yields whole results.
+STREAMING_SCHEMA = LLMReviewAnalysis.model_json_schema()
+
+_THREE_STAR_RESPONSE = "Thank you for your honest review. We appreciate your feedback and are always looking for ways to improve your experience."
+
+# Indexed by rating; slot 0 is the default for out-of-range ratings
+FALLBACK_RESPONSES = (
+    _THREE_STAR_RESPONSE,
+    "We sincerely apologize for your disappointing experience. We take your feedback very seriously and will work hard to address these issues.",
+    "We're sorry your experience didn't meet your expectations. Thank you for letting us know - your feedback helps us improve.",
+    _THREE_STAR_RESPONSE,
+    "Thank you for your positive feedback! We're glad you enjoyed your experience. We're always working to make things even better!",
+    "Thank you for your excellent review! We're thrilled that you had such a wonderful experience with us. Your kind words mean a lot to our team!"
+)
+
+_LOW_RATING_ACTIONS = "• Prioritize addressing customer concerns\n• Consider direct outreach to customer\n• Review processes for improvement"
+_MID_RATING_ACTIONS = "• Review feedback for improvement areas\n• Follow up if specific issues mentioned\n• Monitor for patterns"
+_HIGH_RATING_ACTIONS = "• Maintain current service standards\n• Consider featuring positive feedback\n• Thank the customer"
+
+# Indexed like FALLBACK_RESPONSES
+FALLBACK_ACTIONS = (
+    _LOW_RATING_ACTIONS,
+    _LOW_RATING_ACTIONS,
+    _LOW_RATING_ACTIONS,
+    _MID_RATING_ACTIONS,
+    _HIGH_RATING_ACTIONS,
+    _HIGH_RATING_ACTIONS
+)
 
 
 class LLMService:
@@ -29,17 +58,63 @@ class LLMService:
     
     def __init__(self):
         self.settings = get_settings()
-        self._llm = None
-        self._initialized = False
-    
-    def _get_llm(self, temperature: float = 0.5) -> ChatOpenAI:
-        """Get LLM instance with specified temperature"""
-        return ChatOpenAI(
-            model=self.settings.llm_model,
-            temperature=temperature,
-            api_key=self.settings.openai_api_key,
-            request_timeout=self.settings.llm_timeout
+        self._llm: Optional[ChatOpenAI] = None
+        self._analysis_chain: Optional[Runnable] = None
+        self._streaming_chain: Optional[Runnable] = None
+        self._cache = LLMResponseCache(
+            mode=self.settings.llm_cache_mode,
+            local_maxsize=self.settings.llm_cache_local_size,
+            local_ttl_seconds=self.settings.llm_cache_local_ttl_seconds
         )
+        self._batcher = BatchScheduler(
+            self._analyze_batch,
+            max_batch=self.settings.llm_batch_max_size,
+            timeout_s=self.settings.llm_batch_timeout_ms / 1000
+        )
+        # Caps concurrent provider calls so a rate-limited LLM sees a bounded
+        # number of requests. Slots are held by the provider call itself, so a
+        # caller that gives up does not free one while its request is still open.
+        self._llm_slots = asyncio.Semaphore(self.settings.llm_max_inflight)
+    
+    async def stop(self) -> None:
+        """Stop the request batcher, finishing any batched calls (called on shutdown)"""
+        await self._batcher.stop()
+    
+    @property
+    def llm(self) -> ChatOpenAI:
+        """
+        Shared chat model, built on first use.
+        
+        One client for the process lifetime means requests share a pooled,
+        HTTP/2-multiplexed connection instead of a new TLS handshake each.
+        """
+        if self._llm is None:
+            self._llm = ChatOpenAI(
+                model=LLM_MODEL,
+                temperature=LLM_TEMPERATURE,
+                api_key=self.settings.openai_api_key,
+                request_timeout=LLM_TIMEOUT,
+                max_retries=self.settings.llm_max_retries,
+                http_async_client=httpx.AsyncClient(
+                    http2=True,
+                    limits=httpx.Limits(max_connections=100, max_keepalive_connections=100)
+                )
+            )
+        return self._llm
+    
+    @property
+    def analysis_chain(self) -> Runnable:
+        """Structured-output runnable returning LLMReviewAnalysis, bound once"""
+        if self._analysis_chain is None:
+            self._analysis_chain = self.llm.with_structured_output(LLMReviewAnalysis)
+        return self._analysis_chain
+    
+    @property
+    def streaming_chain(self) -> Runnable:
+        """Structured-output runnable streaming partial dicts, bound once"""
+        if self._streaming_chain is None:
+            self._streaming_chain = self.llm.with_structured_output(STREAMING_SCHEMA)
+        return self._streaming_chain
     
     async def process_review(self, rating: int, review_text: str) -> Dict[str, Any]:
         """
@@ -53,42 +128,133 @@ class LLMService:
             Dictionary with user_response, admin_summary, recommended_actions, model_used
         """
         try:
-            llm = self._get_llm(temperature=0.5)
-            structured_llm = llm.with_structured_output(LLMReviewAnalysis)
-            prompt = ChatPromptTemplate.from_template(UNIFIED_REVIEW_ANALYSIS_PROMPT)
-            chain = prompt | structured_llm
-            result: LLMReviewAnalysis = await chain.ainvoke({
-                "rating": rating,
-                "review_text": review_text
-            })
+            cache_key = self._cache_key(rating, review_text)
+            cached = await self._cache.get(cache_key)
+            if cached is not None:
+                logger.info("LLM cache hit for %s-star review", rating)
+                return cached
+            
+            result: LLMReviewAnalysis = await self._batcher.submit(
+                render_unified_prompt(rating, review_text)
+            )
+            
+            logger.info("Successfully generated structured output for %s-star review", rating)
+            
+            llm_results = self._build_results(result)
+            await self._cache.set(cache_key, llm_results)
+            
+            return llm_results
+            
+        except Exception as e:
+            logger.error("LLM structured output error: %s", e)
+            return self._get_fallback_results(rating, review_text)
+    
+    async def stream_review(self, rating: int, review_text: str) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Process a review, streaming the user response as it is generated
+        
+        Args:
+            rating: Star rating (1-5)
+            review_text: The review text
+            
+        Yields:
+            ("delta", str) for each new fragment of user_response, then a single
+            ("done", dict) with the same keys as process_review
+        """
+        try:
+            cache_key = self._cache_key(rating, review_text)
+            cached = await self._cache.get(cache_key)
+            if cached is not None:
+                logger.info("LLM cache hit for %s-star review", rating)
+                yield "delta", cached["user_response"]
+                yield "done", cached
+                return
             
-            logger.info(f"Successfully generated structured output for {rating}-star review")
+            # The provider stream runs in its own task so its slot and time
+            # budget cover only the LLM call, not how fast the client reads
+            fragments: asyncio.Queue = asyncio.Queue()
+            producer = asyncio.create_task(self._stream_analysis(rating, review_text, fragments))
+            try:
+                while (fragment := await fragments.get()) is not None:
+                    yield "delta", fragment
+                result = await producer
+            finally:
+                producer.cancel()
             
-            return {
-                "user_response": result.user_response.strip(),
-                "admin_summary": result.admin_summary.strip(),
-                "recommended_actions": result.recommended_actions.strip(),
-                "model_used": self.settings.llm_model
-            }
+            logger.info("Successfully streamed structured output for %s-star review", rating)
+            
+            llm_results = self._build_results(result)
+            await self._cache.set(cache_key, llm_results)
             
         except Exception as e:
-            logger.error(f"LLM structured output error: {e}")
-            return {
-                "user_response": self.get_fallback_response(rating),
-                "admin_summary": f"[Processing failed] Rating: {rating}/5. Review length: {len(review_text)} chars.",
-                "recommended_actions": self._get_fallback_actions(rating),
-                "model_used": "fallback"
-            }
+            logger.error("LLM streaming error: %s", e)
+            llm_results = self._get_fallback_results(rating, review_text)
+        
+        yield "done", llm_results
+    
+    async def _stream_analysis(self, rating: int, review_text: str, fragments: asyncio.Queue) -> LLMReviewAnalysis:
+        """
+        Stream one analysis from the provider, putting new user_response
+        fragments on the queue followed by None when the stream ends
+        """
+        try:
+            partial: Dict[str, Any] = {}
+            sent = 0
+            # The budget covers waiting for a slot too, matching submit_review's wait_for
+            async with asyncio.timeout(self.settings.llm_response_timeout):
+                async with self._llm_slots:
+                    async for partial in self.streaming_chain.astream(
+                        render_unified_prompt(rating, review_text)
+                    ):
+                        user_response = partial.get("user_response") or ""
+                        if len(user_response) > sent:
+                            fragments.put_nowait(user_response[sent:])
+                            sent = len(user_response)
+            return LLMReviewAnalysis.model_validate(partial)
+        finally:
+            fragments.put_nowait(None)
+    
+    async def _analyze_batch(self, prompts: List[str]) -> List[Any]:
+        """Run a batch of rendered prompts concurrently through the structured-output chain"""
+        return await asyncio.gather(*(self._analyze(prompt) for prompt in prompts), return_exceptions=True)
+    
+    async def _analyze(self, prompt: str) -> LLMReviewAnalysis:
+        """Run one provider call while holding an in-flight slot"""
+        async with self._llm_slots:
+            return await self.analysis_chain.ainvoke(prompt)
+    
+    def _cache_key(self, rating: int, review_text: str) -> str:
+        """Build the response cache key for a review"""
+        return make_cache_key(
+            PROMPT_DIGEST,
+            LLM_MODEL,
+            LLM_TEMPERATURE,
+            rating,
+            review_text
+        )
+    
+    def _build_results(self, result: LLMReviewAnalysis) -> Dict[str, Any]:
+        """Convert a structured LLM result into the service's result dict"""
+        return {
+            "user_response": result.user_response.strip(),
+            "admin_summary": result.admin_summary.strip(),
+            "recommended_actions": result.recommended_actions.strip(),
+            "model_used": LLM_MODEL
+        }
+    
+    def _get_fallback_results(self, rating: int, review_text: str) -> Dict[str, Any]:
+        """Get the full result dict used when the LLM fails"""
+        return {
+            "user_response": self.get_fallback_response(rating),
+            "admin_summary": f"[Processing failed] Rating: {rating}/5. Review length: {len(review_text)} chars.",
+            "recommended_actions": self._get_fallback_actions(rating),
+            "model_used": "fallback"
+        }
     
     def get_fallback_response(self, rating: int) -> str:
         """Get fallback response when LLM fails"""
-        return FALLBACK_RESPONSES.get(rating, FALLBACK_RESPONSES[3])
+        return FALLBACK_RESPONSES[rating if 1 <= rating <= 5 else 0]
     
     def _get_fallback_actions(self, rating: int) -> str:
         """Get fallback recommended actions"""
-        if rating >= 4:
-            return "• Maintain current service standards\n• Consider featuring positive feedback\n• Thank the customer"
-        elif rating == 3:
-            return "• Review feedback for improvement areas\n• Follow up if specific issues mentioned\n• Monitor for patterns"
-        else:
-            return "• Prioritize addressing customer concerns\n• Consider direct outreach to customer\n• Review processes for improvement"
+        return FALLBACK_ACTIONS[rating if 1 <= rating <= 5 else 0]
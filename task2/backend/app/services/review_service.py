@@ -1,56 +1,127 @@
 
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+import asyncio
 from typing import Dict, Any, Optional, List
 import logging
+import re
 from bson import ObjectId
+from pymongo.errors import BulkWriteError
 
+from app.config import get_settings
 from app.database import get_reviews_collection
 from app.models import ReviewItem
+from app.utils.batching import BatchScheduler
 
 logger = logging.getLogger(__name__)
 
+# Index covering each (has rating filter, sort field) combination get_reviews can issue
+INDEX_FOR_QUERY = {
+    (False, "metadata.submission_time"): "submission_time_desc",
+    (False, "rating"): "rating_time_compound",
+    (False, "metadata.status"): "status_time_compound",
+    (True, "metadata.submission_time"): "rating_time_compound",
+    (True, "rating"): "rating_time_compound",
+    (True, "metadata.status"): "rating_status_compound",
+}
+
+# Fields read into ReviewItem; skips processing metadata and the text score
+REVIEW_ITEM_PROJECTION = {
+    "rating": 1,
+    "review_text": 1,
+    "user_response": 1,
+    "admin_summary": 1,
+    "recommended_actions": 1,
+    "metadata.submission_time": 1,
+    "metadata.status": 1
+}
+
+
+async def _insert_reviews(documents: List[Dict[str, Any]]) -> List[Any]:
+    """Insert a batch of reviews in one unordered insert_many, returning an ID or error per document"""
+    try:
+        await get_reviews_collection().insert_many(documents, ordered=False)
+    except BulkWriteError as e:
+        # Unordered inserts keep going past a failed document, so only the
+        # documents listed in writeErrors were not stored
+        results: List[Any] = [document["_id"] for document in documents]
+        for error in e.details.get("writeErrors", []):
+            results[error["index"]] = RuntimeError(error.get("errmsg", "Review insert failed"))
+        return results
+    return [document["_id"] for document in documents]
+
+
+_settings = get_settings()
+# Coalesces concurrent saves into insert_many calls; started in the app lifespan
+review_writer = BatchScheduler(
+    _insert_reviews,
+    max_batch=_settings.review_write_batch_size,
+    timeout_s=_settings.review_write_batch_timeout_ms / 1000
+)
+
 
 class ReviewService:
     """Service for handling review-related operations"""
     
-    async def save_review(
-        self,
+    def __init__(self):
+        self._collection = None
+        self.search_substring_fallback = _settings.search_substring_fallback
+    
+    @property
+    def collection(self):
+        """Reviews collection handle, resolved on first use after startup"""
+        if self._collection is None:
+            self._collection = get_reviews_collection()
+        return self._collection
+    
+    @classmethod
+    def build_review_doc(
+        cls,
         rating: int,
         review_text: str,
-        user_response: str,
-        admin_summary: str,
-        recommended_actions: str,
+        llm_results: Dict[str, Any],
         processing_time_ms: int,
-        llm_model: str,
-        status: str = "processed"
-    ) -> str:
+        status: str = "processed",
+        review_id: Optional[ObjectId] = None
+    ) -> Dict[str, Any]:
         """
-        Save a new review to the database.
+        Build the stored document for a review.
         
-        Returns:
-            The ID of the created document
+        The submission time is sampled here, when the request is handled,
+        rather than when the batched insert runs.
+        
+        Args:
+            llm_results: Dict with user_response, admin_summary,
+                recommended_actions and model_used
+            review_id: Client-generated ID, e.g. one already returned to the user
         """
-        collection = get_reviews_collection()
+        submission_time = datetime.now(timezone.utc)
         
-        document = {
+        return {
+            "_id": review_id or ObjectId(),
             "rating": rating,
             "review_text": review_text,
-            "user_response": user_response,
-            "admin_summary": admin_summary,
-            "recommended_actions": recommended_actions,
+            "user_response": llm_results["user_response"],
+            "admin_summary": llm_results["admin_summary"],
+            "recommended_actions": llm_results["recommended_actions"],
             "metadata": {
-                "submission_time": datetime.utcnow(),
+                "submission_time": submission_time,
+                "submission_date": submission_time.date().isoformat(),
                 "processing_time_ms": processing_time_ms,
-                "llm_model": llm_model,
+                "llm_model": llm_results["model_used"],
                 "status": status
             }
         }
+    
+    async def save_review(self, document: Dict[str, Any]) -> str:
+        """
+        Save a review document built by build_review_doc.
         
-        result = await collection.insert_one(document)
-        
-        logger.info(f"Review saved with ID: {result.inserted_id}")
+        The insert is queued and written together with other concurrent saves.
         
-        return str(result.inserted_id)
+        Returns:
+            The ID of the created document
+        """
+        return str(await review_writer.submit(document))
     
     async def get_reviews(
         self,
@@ -67,17 +138,24 @@ class ReviewService:
         Returns:
             Dictionary with reviews list, total_count, and has_more flag
         """
-        collection = get_reviews_collection()
+        collection = self.collection
         filter_query = {}
         
         if rating_filter is not None:
             filter_query["rating"] = rating_filter
         
+        use_text_search = False
         if search_query:
-            filter_query["review_text"] = {
-                "$regex": search_query,
-                "$options": "i"  
-            }
+            if self.search_substring_fallback and len(search_query.split()) == 1:
+                # The text index only matches whole (stemmed) words, so single
+                # fragments like "delic" need a substring scan when enabled.
+                filter_query["review_text"] = {
+                    "$regex": re.escape(search_query.strip()),
+                    "$options": "i"
+                }
+            else:
+                filter_query["$text"] = {"$search": search_query}
+                use_text_search = True
         skip = (page - 1) * page_size
         sort_direction = -1 if sort_order == "desc" else 1
         sort_field_map = {
@@ -86,14 +164,40 @@ class ReviewService:
             "status": "metadata.status"
         }
         sort_field = sort_field_map.get(sort_by, "metadata.submission_time")
-        total_count = await collection.count_documents(filter_query)
-        cursor = collection.find(filter_query)
-        cursor = cursor.sort(sort_field, sort_direction)
-        cursor = cursor.skip(skip).limit(page_size)
-        
-        reviews = []
-        async for doc in cursor:
-            reviews.append(ReviewItem(
+        sort_stage = {sort_field: sort_direction}
+        pipeline = [{"$match": filter_query}]
+        
+        if use_text_search and sort_by == "relevance":
+            pipeline.append({"$addFields": {"score": {"$meta": "textScore"}}})
+            sort_stage = {"score": -1}
+        
+        # $facet sub-pipelines cannot use indexes, so the sort has to precede it
+        # for the planner to push $match and $sort onto the hinted index
+        pipeline += [
+            {"$sort": sort_stage},
+            {
+                "$facet": {
+                    "items": [
+                        {"$skip": skip},
+                        {"$limit": page_size},
+                        {"$project": REVIEW_ITEM_PROJECTION}
+                    ],
+                    "total": [{"$count": "count"}]
+                }
+            }
+        ]
+        
+        aggregate_options = {}
+        if not use_text_search:
+            # $text queries pick the text index themselves and reject hints
+            aggregate_options["hint"] = self._pick_index(rating_filter, sort_field)
+        
+        cursor = await collection.aggregate(pipeline, **aggregate_options)
+        facets = (await cursor.to_list(length=1))[0]
+        total_count = facets["total"][0]["count"] if facets["total"] else 0
+        
+        reviews = [
+            ReviewItem.model_construct(
                 id=str(doc["_id"]),
                 rating=doc["rating"],
                 review_text=doc["review_text"],
@@ -102,7 +206,9 @@ class ReviewService:
                 recommended_actions=doc["recommended_actions"],
                 submission_time=doc["metadata"]["submission_time"],
                 status=doc["metadata"]["status"]
-            ))
+            )
+            for doc in facets["items"]
+        ]
         
         has_more = (skip + len(reviews)) < total_count
         
@@ -112,6 +218,16 @@ class ReviewService:
             "has_more": has_more
         }
     
+    @staticmethod
+    def _pick_index(rating_filter: Optional[int], sort_field: str) -> str:
+        """Choose the index that serves the $match and $sort stages of get_reviews"""
+        return INDEX_FOR_QUERY[(rating_filter is not None, sort_field)]
+    
+    async def _aggregate(self, pipeline: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Run an aggregation and return all result documents"""
+        cursor = await self.collection.aggregate(pipeline)
+        return await cursor.to_list(length=None)
+    
     async def get_analytics(self) -> Dict[str, Any]:
         """
         Get analytics data for admin dashboard.
@@ -119,35 +235,46 @@ class ReviewService:
         Returns:
             Dictionary with analytics metrics
         """
-        collection = get_reviews_collection()
-        total_reviews = await collection.count_documents({})
-        rating_pipeline = [
+        today_start = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        week_start = today_start - timedelta(days=today_start.weekday())
+        today = today_start.date().isoformat()
+        by_rating_pipeline = [
+            {"$group": {"_id": "$rating", "count": {"$sum": 1}}}
+        ]
+        # A top-level $match (not inside $facet) lets the week's bucket be read
+        # from the submission_date_desc index instead of scanning every review
+        recent_pipeline = [
+            {"$match": {"metadata.submission_date": {"$gte": week_start.date().isoformat()}}},
             {
                 "$group": {
-                    "_id": "$rating",
-                    "count": {"$sum": 1}
+                    "_id": None,
+                    "this_week": {"$sum": 1},
+                    "today": {
+                        "$sum": {"$cond": [{"$eq": ["$metadata.submission_date", today]}, 1, 0]}
+                    }
                 }
             }
         ]
         
+        by_rating, recent = await asyncio.gather(
+            self._aggregate(by_rating_pipeline),
+            self._aggregate(recent_pipeline)
+        )
+        
         rating_distribution = {"1": 0, "2": 0, "3": 0, "4": 0, "5": 0}
+        total_reviews = 0
         total_rating_sum = 0
         
-        async for doc in collection.aggregate(rating_pipeline):
-            rating = str(doc["_id"])
+        for doc in by_rating:
             count = doc["count"]
-            rating_distribution[rating] = count
+            rating_distribution[str(doc["_id"])] = count
+            total_reviews += count
             total_rating_sum += doc["_id"] * count
         
         average_rating = round(total_rating_sum / total_reviews, 2) if total_reviews > 0 else 0.0
-        today_start = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        reviews_today = await collection.count_documents({
-            "metadata.submission_time": {"$gte": today_start}
-        })
-        week_start = today_start - timedelta(days=today_start.weekday())
-        reviews_this_week = await collection.count_documents({
-            "metadata.submission_time": {"$gte": week_start}
-        })
+        recent = recent[0] if recent else {}
+        reviews_today = recent.get("today", 0)
+        reviews_this_week = recent.get("this_week", 0)
         
         return {
             "total_reviews": total_reviews,
@@ -159,7 +286,7 @@ class ReviewService:
     
     async def get_review_by_id(self, review_id: str) -> Optional[Dict[str, Any]]:
         """Get a single review by ID"""
-        collection = get_reviews_collection()
+        collection = self.collection
         
         try:
             doc = await collection.find_one({"_id": ObjectId(review_id)})
@@ -179,5 +306,5 @@ class ReviewService:
             return None
             
         except Exception as e:
-            logger.error(f"Error fetching review {review_id}: {e}")
+            logger.error("Error fetching review %s: %s", review_id, e)
             return None
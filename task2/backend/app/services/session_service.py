@@ -0,0 +1,91 @@
+"""
+Admin session store backed by MongoDB.
+Sessions are shared across worker processes and expired by a TTL index.
+"""
+
+from datetime import datetime, timezone
+from typing import Optional
+import logging
+import time
+from cachetools import TTLCache
+
+from app.database import get_sessions_collection
+
+logger = logging.getLogger(__name__)
+
+SESSION_CACHE_SIZE = 1024
+SESSION_CACHE_TTL_SECONDS = 60
+
+
+class SessionService:
+    """Service for creating, validating and revoking admin sessions"""
+
+    def __init__(self):
+        # Per-process cache of recently validated sessions, so a dashboard
+        # polling several endpoints doesn't hit MongoDB on every request.
+        # A logout in another worker is picked up once the entry ages out.
+        self._cache: TTLCache = TTLCache(
+            maxsize=SESSION_CACHE_SIZE,
+            ttl=SESSION_CACHE_TTL_SECONDS
+        )
+        self._collection = None
+
+    @property
+    def collection(self):
+        """Sessions collection handle, resolved on first use after startup"""
+        if self._collection is None:
+            self._collection = get_sessions_collection()
+        return self._collection
+
+    async def create_session(self, token: str, expires_at: datetime) -> None:
+        """Persist a new session token"""
+        collection = self.collection
+        document = {
+            "_id": token,
+            "created_at": datetime.now(timezone.utc),
+            "expires_at": expires_at,
+            "expires_at_ts": expires_at.timestamp()
+        }
+
+        await collection.insert_one(document)
+        self._cache[token] = document
+
+    async def get_session(self, token: str) -> Optional[dict]:
+        """
+        Look up a session by token.
+
+        Returns:
+            The session document, or None if unknown or expired
+        """
+        doc = self._cache.get(token)
+
+        if doc is None:
+            collection = self.collection
+            doc = await collection.find_one({"_id": token})
+
+            if doc is None:
+                return None
+
+            self._cache[token] = doc
+
+        # The TTL monitor only runs periodically, so expired documents can
+        # linger for up to a minute after expires_at. Comparing epoch seconds
+        # avoids datetime arithmetic on every authenticated request.
+        if time.time() > doc.get("expires_at_ts", 0):
+            await self.delete_session(token)
+            return None
+
+        return doc
+
+    async def delete_session(self, token: str) -> None:
+        """Revoke a session token"""
+        self._cache.pop(token, None)
+        collection = self.collection
+        await collection.delete_one({"_id": token})
+
+    async def count_active_sessions(self) -> int:
+        """Count sessions that have not yet expired"""
+        collection = self.collection
+        return await collection.count_documents({
+            "expires_at": {"$gt": datetime.now(timezone.utc)}
+        })
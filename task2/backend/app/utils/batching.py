@@ -0,0 +1,132 @@
+"""
+Micro-batching for concurrent async requests
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, List, Optional, Tuple
+
+
+class BatchScheduler:
+    """
+    Collects concurrent requests into small batches before dispatching them.
+
+    The first queued item opens a batch window; the batch is dispatched once it
+    reaches max_batch items or timeout_s has elapsed. With timeout_s=0 a batch
+    is whatever is already queued, so a lone item is dispatched immediately.
+    Batches run as separate tasks so a slow call never holds up the next window.
+
+    The handler receives the queued items and must return one result per item,
+    in order; an exception in the result list fails only that item's caller.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[Any]], Awaitable[List[Any]]],
+        max_batch: int = 8,
+        timeout_s: float = 0.05
+    ):
+        self._handler = handler
+        self.max_batch = max_batch
+        self.timeout_s = timeout_s
+        self._queue: Optional[asyncio.Queue] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._inflight: set = set()
+        self._stopped = False
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item and wait for its result"""
+        if self._stopped:
+            raise RuntimeError("Batch scheduler has been stopped")
+        if self._runner is None or self._runner.done():
+            self.start()
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        return await future
+
+    def start(self) -> None:
+        """Start the batching task on the running event loop"""
+        # Also called lazily from submit so the queue binds to the serving loop
+        if self._runner is not None and not self._runner.done():
+            return
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._stopped = False
+        self._runner = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Cancel the runner, flush anything still queued and wait for in-flight
+        batches. Later submits raise instead of restarting the runner.
+        """
+        self._stopped = True
+        if self._runner is not None:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+
+        if self._queue is not None:
+            pending = []
+            while not self._queue.empty():
+                pending.append(self._queue.get_nowait())
+            for i in range(0, len(pending), self.max_batch):
+                self._spawn(pending[i:i + self.max_batch])
+
+        if self._inflight:
+            await asyncio.gather(*self._inflight, return_exceptions=True)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        batch: List[Tuple[Any, asyncio.Future]] = []
+
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                while len(batch) < self.max_batch and not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                deadline = loop.time() + self.timeout_s
+
+                while len(batch) < self.max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                self._spawn(batch)
+                batch = []
+        except asyncio.CancelledError:
+            # Items in an open batch window are already off the queue; dispatch
+            # them so their callers are not left waiting forever
+            if batch:
+                self._spawn(batch)
+            raise
+
+    def _spawn(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        task = asyncio.create_task(self._dispatch(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        # Skip items whose caller already gave up (e.g. timed out)
+        batch = [(item, future) for item, future in batch if not future.done()]
+        if not batch:
+            return
+        try:
+            results = await self._handler([item for item, _ in batch])
+        except Exception as e:
+            results = [e] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
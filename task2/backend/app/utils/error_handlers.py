@@ -24,7 +24,7 @@ def setup_exception_handlers(app: FastAPI):
             message = error["msg"]
             error_messages.append(f"{field}: {message}")
         
-        logger.warning(f"Validation error: {error_messages}")
+        logger.warning("Validation error: %s", error_messages)
         
         return JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -53,7 +53,7 @@ def setup_exception_handlers(app: FastAPI):
     @app.exception_handler(ValueError)
     async def value_error_handler(request: Request, exc: ValueError):
         """Handle ValueError"""
-        logger.warning(f"Value error: {exc}")
+        logger.warning("Value error: %s", exc)
         
         return JSONResponse(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -67,7 +67,7 @@ def setup_exception_handlers(app: FastAPI):
     @app.exception_handler(Exception)
     async def general_exception_handler(request: Request, exc: Exception):
         """Handle all other exceptions"""
-        logger.error(f"Unhandled exception: {exc}", exc_info=True)
+        logger.error("Unhandled exception: %s", exc, exc_info=True)
         
         return JSONResponse(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
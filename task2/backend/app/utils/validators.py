@@ -2,9 +2,16 @@
 Custom validators for input validation
 """
 
-import re
 from typing import Tuple
 
+# Non-whitespace ASCII control characters (incl. NUL and DEL) mapped to None.
+# Whitespace controls such as \t and \n are left for str.split() to collapse.
+_CONTROL_CHAR_TABLE = {
+    code: None
+    for code in (*range(32), 127)
+    if not chr(code).isspace()
+}
+
 
 def validate_review_text(text: str) -> Tuple[bool, str]:
     """
@@ -20,14 +27,13 @@ def validate_review_text(text: str) -> Tuple[bool, str]:
     
     if len(stripped) > 1000:
         return False, "Review must not exceed 1000 characters"
-    if len(set(stripped.lower())) < 5:
+    lowered = stripped.lower()
+    if len(set(lowered)) < 5:
         return False, "Please write a more detailed review"
 
-    words = stripped.split()
-    if len(words) > 3:
-        unique_words = set(w.lower() for w in words)
-        if len(unique_words) < len(words) * 0.3:
-            return False, "Please avoid excessive word repetition"
+    words = lowered.split()
+    if len(words) > 3 and len(set(words)) < len(words) * 0.3:
+        return False, "Please avoid excessive word repetition"
     
     return True, ""
 
@@ -42,11 +48,7 @@ def sanitize_input(text: str) -> str:
     Returns:
         Sanitized text
     """
-    text = text.replace('\x00', '')
-    text = ' '.join(text.split())
-    text = ''.join(char for char in text if char == '\n' or (ord(char) >= 32 and ord(char) != 127))
-    
-    return text.strip()
+    return ' '.join(text.translate(_CONTROL_CHAR_TABLE).split())
 
 
 def is_valid_rating(rating: int) -> bool:
@@ -0,0 +1,16 @@
+"""
+Gunicorn configuration for production deployments
+
+Usage:
+    gunicorn app.main:app -c gunicorn.conf.py
+"""
+
+import multiprocessing
+import os
+
+bind = f"{os.getenv('BACKEND_HOST', '0.0.0.0')}:{os.getenv('BACKEND_PORT', '8000')}"
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count() * 2 + 1))
+worker_class = "uvicorn_worker.UvicornWorker"
+worker_tmp_dir = "/dev/shm"
+timeout = 60
+keepalive = 5
@@ -0,0 +1,38 @@
+"""
+One-off migration: populate metadata.submission_date on reviews saved before the field existed.
+
+Run once from task2/backend:
+    python -m scripts.backfill_submission_dates
+"""
+
+import asyncio
+
+from pymongo import AsyncMongoClient
+
+from app.config import get_settings
+
+
+async def backfill_submission_dates() -> int:
+    """Set submission_date from submission_time wherever it is missing"""
+    settings = get_settings()
+    client = AsyncMongoClient(settings.mongodb_uri, serverSelectionTimeoutMS=5000)
+
+    try:
+        result = await client[settings.mongodb_db_name].reviews.update_many(
+            {"metadata.submission_date": None},
+            [{
+                "$set": {
+                    "metadata.submission_date": {
+                        "$dateToString": {"format": "%Y-%m-%d", "date": "$metadata.submission_time"}
+                    }
+                }
+            }]
+        )
+        return result.modified_count
+    finally:
+        await client.close()
+
+
+if __name__ == "__main__":
+    modified = asyncio.run(backfill_submission_dates())
+    print(f"Backfilled submission_date on {modified} reviews")
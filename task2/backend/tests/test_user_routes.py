@@ -0,0 +1,131 @@
+"""
+Route tests for the user submission endpoints, with the LLM and review writer stubbed
+"""
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routes import user as user_routes
+from app.services import review_service as review_service_module
+
+REVIEW = {"rating": 5, "review_text": "The food was absolutely amazing and the staff were friendly."}
+
+LLM_RESULTS = {
+    "user_response": "Thank you for the kind words!",
+    "admin_summary": "Very positive review of food and staff.",
+    "recommended_actions": "• Thank the customer",
+    "model_used": "test-model"
+}
+
+
+class FakeWriter:
+    """Stands in for review_writer and records submitted documents"""
+
+    def __init__(self):
+        self.documents = []
+
+    async def submit(self, document):
+        self.documents.append(document)
+        return document["_id"]
+
+
+@pytest.fixture
+def writer(monkeypatch):
+    fake = FakeWriter()
+    monkeypatch.setattr(review_service_module, "review_writer", fake)
+    return fake
+
+
+@pytest.fixture
+def client():
+    # Not used as a context manager, so the lifespan (MongoDB connect) is skipped
+    return TestClient(app)
+
+
+def _parse_sse(body: bytes):
+    events = []
+    for frame in body.split(b"\n\n"):
+        if not frame:
+            continue
+        event_line, data_line = frame.split(b"\n")
+        events.append((event_line[len(b"event: "):].decode(), orjson.loads(data_line[len(b"data: "):])))
+    return events
+
+
+def test_submit_review_saves_processed_review(client, writer, monkeypatch):
+    async def process_review(rating, review_text):
+        return dict(LLM_RESULTS)
+
+    monkeypatch.setattr(user_routes.llm_service, "process_review", process_review)
+
+    response = client.post("/api/user/submit-review", json=REVIEW)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["success"] is True
+    assert data["user_response"] == LLM_RESULTS["user_response"]
+
+    [document] = writer.documents
+    assert str(document["_id"]) == data["submission_id"]
+    assert document["rating"] == REVIEW["rating"]
+    assert document["admin_summary"] == LLM_RESULTS["admin_summary"]
+    assert document["metadata"]["status"] == "processed"
+    assert document["metadata"]["llm_model"] == "test-model"
+    assert document["metadata"]["submission_date"] == document["metadata"]["submission_time"].date().isoformat()
+
+
+def test_submit_review_falls_back_and_saves_failed_review(client, writer, monkeypatch):
+    async def process_review(rating, review_text):
+        raise RuntimeError("provider down")
+
+    monkeypatch.setattr(user_routes.llm_service, "process_review", process_review)
+
+    response = client.post("/api/user/submit-review", json=REVIEW)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["user_response"] == user_routes.llm_service.get_fallback_response(REVIEW["rating"])
+
+    [document] = writer.documents
+    assert str(document["_id"]) == data["submission_id"]
+    assert document["metadata"]["status"] == "failed"
+    assert document["metadata"]["llm_model"] == "fallback"
+
+
+def test_submit_review_rejects_repetitive_text(client, writer):
+    response = client.post(
+        "/api/user/submit-review",
+        json={"rating": 3, "review_text": "bad bad bad bad bad bad bad bad bad bad"}
+    )
+
+    assert response.status_code == 400
+    assert writer.documents == []
+
+
+def test_submit_review_stream_emits_deltas_then_done(client, writer, monkeypatch):
+    async def stream_review(rating, review_text):
+        yield "delta", "Thank you "
+        yield "delta", "for the kind words!"
+        yield "done", dict(LLM_RESULTS)
+
+    monkeypatch.setattr(user_routes.llm_service, "stream_review", stream_review)
+
+    response = client.post("/api/user/submit-review/stream", json=REVIEW)
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    events = _parse_sse(response.content)
+    assert events[:2] == [
+        ("delta", {"text": "Thank you "}),
+        ("delta", {"text": "for the kind words!"})
+    ]
+    event, done = events[2]
+    assert event == "done"
+    assert done["success"] is True
+    assert done["user_response"] == LLM_RESULTS["user_response"]
+
+    [document] = writer.documents
+    assert str(document["_id"]) == done["submission_id"]
+    assert document["metadata"]["status"] == "processed"
@@ -6,6 +6,7 @@
 const API_BASE_URL = window.location.origin;
 const API_ENDPOINTS = {
     submitReview: `${API_BASE_URL}/api/user/submit-review`,
+    submitReviewStream: `${API_BASE_URL}/api/user/submit-review/stream`,
     health: `${API_BASE_URL}/api/user/health`
 };
 
@@ -153,7 +154,7 @@ async function submitReview() {
     };
 
     try {
-        const response = await fetch(API_ENDPOINTS.submitReview, {
+        const response = await fetch(API_ENDPOINTS.submitReviewStream, {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json'
@@ -161,13 +162,29 @@ async function submitReview() {
             body: JSON.stringify(payload)
         });
 
-        const data = await response.json();
-
-        if (response.ok && data.success) {
-            showResponse(data);
-        } else {
+        if (!response.ok) {
+            const data = await response.json();
             const errorMsg = data.detail || data.error || 'Failed to submit review';
             showError(errorMsg);
+            return;
+        }
+
+        let streamedText = '';
+        let finalData = null;
+
+        await readEventStream(response, (event, data) => {
+            if (event === 'delta') {
+                streamedText += data.text;
+                showPartialResponse(streamedText);
+            } else if (event === 'done') {
+                finalData = data;
+            }
+        });
+
+        if (finalData && finalData.success) {
+            showResponse(finalData);
+        } else {
+            showError('Failed to submit review');
         }
     } catch (error) {
         console.error('Submit error:', error);
@@ -177,6 +194,46 @@ async function submitReview() {
     }
 }
 
+/**
+ * Read a Server-Sent Events response body, calling onEvent(event, data)
+ * for each complete event as it arrives.
+ */
+async function readEventStream(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const rawEvent = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let event = 'message';
+            let data = '';
+            rawEvent.split('\n').forEach(line => {
+                if (line.startsWith('event: ')) event = line.slice(7);
+                else if (line.startsWith('data: ')) data += line.slice(6);
+            });
+
+            if (data) onEvent(event, JSON.parse(data));
+        }
+    }
+}
+
+function showPartialResponse(text) {
+    reviewCard.style.display = 'none';
+
+    aiResponse.textContent = text;
+    responseMeta.textContent = 'Generating response...';
+    responseCard.style.display = 'block';
+}
+
 function showResponse(data) {
     reviewCard.style.display = 'none';
 